@@ -1,27 +1,23 @@
 """LSF CLI - Main command-line interface."""
 
 import click
-from loguru import logger
-from rich.console import Console
 
 from lsf import __version__
 from lsf.commands import init
 
-console = Console()
-
 
 @click.group()
 @click.version_option(version=__version__, prog_name="lsf")
 @click.option("--debug", is_flag=True, help="Enable debug logging")
-def main(debug: bool) -> None:
+@click.pass_context
+def main(ctx: click.Context, debug: bool) -> None:
     """LSF - Configuration Management CLI for .claude and .lsf folders.
 
     Initialize projects with standard configuration folders from the LSF repository.
     """
-    if debug:
-        logger.enable("lsf")
-    else:
-        logger.disable("lsf")
+    # Logging is configured by the subcommands that actually log, so that
+    # loguru is not imported for `--help` and `--version`.
+    ctx.ensure_object(dict)["debug"] = debug
 
 
 main.add_command(init.init_cmd)
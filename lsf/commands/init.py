@@ -1,19 +1,79 @@
 """Init command - Initialize LSF configuration by cloning and copying folders."""
 
+import os
 import shutil
 import tempfile
 from pathlib import Path
 
 import click
-from loguru import logger
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
-console = Console()
 
 # Repository URL
 LSF_REPO_URL = "https://github.com/jsam/lsf.git"
 
+# Folders pulled from the repository into the project
+CONFIG_FOLDERS = (".claude", ".lsf")
+
+
+# copy_file_range is Linux-only
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+
+
+def _copy_file(source: Path, target: Path) -> None:
+    """Copy a single file, preferring an in-kernel copy via copy_file_range."""
+    if not _HAS_COPY_FILE_RANGE:
+        shutil.copyfile(source, target)
+        shutil.copystat(source, target)
+        return
+
+    try:
+        with open(source, "rb") as fsrc, open(target, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    # Some filesystems stop early; never leave a short file.
+                    raise OSError("copy_file_range stopped before end of file")
+                remaining -= copied
+    except OSError:
+        # The filesystem refused the in-kernel copy, use a regular one.
+        shutil.copyfile(source, target)
+    shutil.copystat(source, target)
+
+
+def _fast_copytree(source: Path, target: Path) -> None:
+    """Recursively copy a directory tree, like shutil.copytree."""
+    target.mkdir(parents=True)
+    with os.scandir(source) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                _fast_copytree(Path(entry.path), target / entry.name)
+            else:
+                _copy_file(Path(entry.path), target / entry.name)
+    shutil.copystat(source, target)
+
+
+def _clone_repo(clone_path: Path) -> None:
+    """Clone the LSF repository, fetching only the configuration folders."""
+    import git
+    from loguru import logger
+
+    try:
+        # Only the config folders are needed: skip history and fetch blobs
+        # for just those paths.
+        repo = git.Repo.clone_from(
+            LSF_REPO_URL,
+            clone_path,
+            depth=1,
+            single_branch=True,
+            multi_options=["--filter=blob:none", "--sparse"],
+        )
+        repo.git.sparse_checkout("set", *CONFIG_FOLDERS)
+    except git.GitCommandError as e:
+        # Partial clone and sparse-checkout need git >= 2.25.
+        logger.warning(f"Sparse clone failed, retrying with a shallow clone: {e}")
+        shutil.rmtree(clone_path, ignore_errors=True)
+        git.Repo.clone_from(LSF_REPO_URL, clone_path, depth=1)
+
 
 @click.command(name="init")
 @click.option(
@@ -37,25 +97,38 @@ def init_cmd(path: str, overwrite: bool, backup: bool) -> None:
     """Initialize LSF configuration by pulling from the LSF repository."""
     project_path = Path(path).resolve()
 
-    console.print(
-        f"🚀 Initializing LSF configuration in [bold]{project_path}[/bold]..."
+    click.echo(
+        f"🚀 Initializing LSF configuration in "
+        f"{click.style(str(project_path), bold=True)}..."
     )
 
     # Check for existing folders
     existing_folders = []
-    for folder in [".claude", ".lsf"]:
+    for folder in CONFIG_FOLDERS:
         folder_path = project_path / folder
         if folder_path.exists():
             existing_folders.append(folder)
 
     if existing_folders and not overwrite:
-        console.print(
+        click.secho(
             f"❌ Folders already exist: {', '.join(existing_folders)}\n"
             f"Use --overwrite to replace them or --backup to save them first.",
-            style="red",
+            fg="red",
         )
         raise click.ClickException("Configuration folders already exist")
 
+    # Heavy imports are deferred until we know there is work to do.
+    from loguru import logger
+    from rich.console import Console
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    console = Console()
+
+    if (click.get_current_context().obj or {}).get("debug"):
+        logger.enable("lsf")
+    else:
+        logger.disable("lsf")
+
     # Create temporary directory for cloning
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
@@ -68,9 +141,7 @@ def init_cmd(path: str, overwrite: bool, backup: bool) -> None:
             # Clone repository
             clone_task = progress.add_task("Cloning LSF repository...", total=1)
             try:
-                import git
-
-                git.Repo.clone_from(LSF_REPO_URL, temp_path / "lsf")
+                _clone_repo(temp_path / "lsf")
                 progress.advance(clone_task)
                 logger.info(f"Successfully cloned repository from {LSF_REPO_URL}")
             except Exception as e:
@@ -81,7 +152,7 @@ def init_cmd(path: str, overwrite: bool, backup: bool) -> None:
             # Copy folders
             copy_task = progress.add_task("Copying configuration folders...", total=2)
 
-            for folder in [".claude", ".lsf"]:
+            for folder in CONFIG_FOLDERS:
                 source_path = temp_path / "lsf" / folder
                 target_path = project_path / folder
 
@@ -108,7 +179,7 @@ def init_cmd(path: str, overwrite: bool, backup: bool) -> None:
 
                 # Copy folder
                 try:
-                    shutil.copytree(source_path, target_path)
+                    _fast_copytree(source_path, target_path)
                     console.print(f"✅ Copied {folder}", style="green")
                     logger.info(f"Successfully copied {folder} to {target_path}")
                 except Exception as e:
@@ -1,11 +1,15 @@
 """Tests for the init command."""
 
+import subprocess
+import sys
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import pytest
 from click.testing import CliRunner
 
 from lsf.cli import main
+from lsf.commands.init import _copy_file, _fast_copytree
 
 
 class TestInitCommand:
@@ -42,6 +46,39 @@ class TestInitCommand:
             assert result.exit_code != 0
             assert "Failed to clone repository" in result.output
 
+    @patch("git.Repo")
+    def test_init_sparse_clone(self, mock_repo):
+        """Test init clones shallowly and checks out only the config folders."""
+        with self.runner.isolated_filesystem():
+            self.runner.invoke(main, ["init"])
+
+        mock_repo.clone_from.assert_called_once()
+        _, kwargs = mock_repo.clone_from.call_args
+        assert kwargs["depth"] == 1
+        assert kwargs["single_branch"] is True
+        assert kwargs["multi_options"] == ["--filter=blob:none", "--sparse"]
+        mock_repo.clone_from.return_value.git.sparse_checkout.assert_called_once_with(
+            "set", ".claude", ".lsf"
+        )
+
+    @patch("git.Repo")
+    def test_init_sparse_clone_fallback(self, mock_repo):
+        """Test init retries with a plain shallow clone on older git."""
+        import git
+
+        mock_repo.clone_from.side_effect = [
+            git.GitCommandError("clone", 129, b"unknown option `sparse'"),
+            MagicMock(),
+        ]
+
+        with self.runner.isolated_filesystem():
+            result = self.runner.invoke(main, ["init"])
+
+        assert "Failed to clone repository" not in result.output
+        assert mock_repo.clone_from.call_count == 2
+        _, kwargs = mock_repo.clone_from.call_args
+        assert kwargs == {"depth": 1}
+
     def test_cli_version(self):
         """Test CLI version command."""
         result = self.runner.invoke(main, ["--version"])
@@ -54,3 +91,75 @@ class TestInitCommand:
         assert result.exit_code == 0
         assert "LSF - Configuration Management CLI" in result.output
         assert "init" in result.output
+
+    @pytest.mark.parametrize("args", [[], ["--help"], ["init", "--help"]])
+    def test_cli_import_is_lazy(self, args):
+        """Test the CLI does not pull in rich or loguru for help output."""
+        code = (
+            "import sys; from lsf.cli import main; "
+            f"main({args!r}, standalone_mode=False) if {bool(args)} else None; "
+            "sys.stderr.write(str(any(m in sys.modules for m in "
+            "('rich', 'loguru'))))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        assert result.returncode == 0
+        assert result.stderr.strip() == "False"
+
+    def test_init_debug_flag_enables_logging(self):
+        """Test --debug is passed through to the init command's logger."""
+        with patch("loguru.logger.enable") as mock_enable, patch(
+            "git.Repo"
+        ) as mock_repo:
+            mock_repo.clone_from.side_effect = Exception("Network error")
+            with self.runner.isolated_filesystem():
+                self.runner.invoke(main, ["--debug", "init"])
+        mock_enable.assert_called_once_with("lsf")
+
+    def test_fast_copytree(self, tmp_path):
+        """Test the tree copy preserves nested files and permissions."""
+        source = tmp_path / "src"
+        (source / "scripts" / "bash").mkdir(parents=True)
+        (source / "README.md").write_text("readme")
+        script = source / "scripts" / "bash" / "init.sh"
+        script.write_text("#!/bin/bash\necho hi\n")
+        script.chmod(0o755)
+
+        target = tmp_path / "dst"
+        _fast_copytree(source, target)
+
+        assert (target / "README.md").read_text() == "readme"
+        copied = target / "scripts" / "bash" / "init.sh"
+        assert copied.read_text() == script.read_text()
+        assert copied.stat().st_mode == script.stat().st_mode
+
+    def test_copy_file_falls_back_on_oserror(self, tmp_path):
+        """Test the copy falls back when copy_file_range is refused."""
+        source = tmp_path / "src.bin"
+        source.write_bytes(b"x" * 10_000)
+        target = tmp_path / "dst.bin"
+
+        with patch(
+            "lsf.commands.init.os.copy_file_range",
+            side_effect=OSError("not supported"),
+            create=True,
+        ), patch("lsf.commands.init._HAS_COPY_FILE_RANGE", True):
+            _copy_file(source, target)
+
+        assert target.read_bytes() == source.read_bytes()
+
+    def test_copy_file_falls_back_on_early_eof(self, tmp_path):
+        """Test a zero return before end of file does not truncate the copy."""
+        source = tmp_path / "src.bin"
+        source.write_bytes(bytes(range(256)) * 40)
+        target = tmp_path / "dst.bin"
+
+        with patch(
+            "lsf.commands.init.os.copy_file_range",
+            side_effect=[4096, 0],
+            create=True,
+        ), patch("lsf.commands.init._HAS_COPY_FILE_RANGE", True):
+            _copy_file(source, target)
+
+        assert target.read_bytes() == source.read_bytes()